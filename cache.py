@@ -0,0 +1,57 @@
+"""
+Cache Helper Functions
+
+Redis-backed response cache for read endpoints.
+Caching is skipped entirely when REDIS_URL is not set, and Redis errors
+are treated as cache misses so reads still fall through to MongoDB.
+"""
+
+import os
+from typing import Optional
+
+from dotenv import load_dotenv
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+# Load environment variables from .env file
+load_dotenv()
+
+redis = None
+
+redis_url = os.getenv("REDIS_URL")
+
+if redis_url:
+    redis = Redis.from_url(redis_url, socket_timeout=0.5, socket_connect_timeout=0.5)
+
+# Helper functions for common cache operations
+async def cache_get_raw(key: str) -> Optional[bytes]:
+    """Return the cached JSON bytes for key without decoding them"""
+    if redis is None:
+        return None
+
+    try:
+        return await redis.get(key)
+    except RedisError:
+        return None
+
+async def cache_set_raw(key: str, value: bytes, ttl: int):
+    """Store already-encoded JSON bytes under key for ttl seconds"""
+    if redis is None:
+        return
+
+    try:
+        await redis.setex(key, ttl, value)
+    except RedisError:
+        pass
+
+async def cache_invalidate(pattern: str):
+    """Delete every key matching the glob pattern"""
+    if redis is None:
+        return
+
+    try:
+        keys = [k async for k in redis.scan_iter(match=pattern)]
+        if keys:
+            await redis.delete(*keys)
+    except RedisError:
+        pass
@@ -5,28 +5,56 @@ MongoDB helper functions ready to use in your backend code.
 Import and use these functions in your API endpoints for database operations.
 """
 
-from pymongo import MongoClient
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import BulkWriteError
 from datetime import datetime, timezone
 import os
 from dotenv import load_dotenv
-from typing import Union
+from typing import List, Union
 from pydantic import BaseModel
 
 # Load environment variables from .env file
 load_dotenv()
 
 _client = None
-db = None
 
 database_url = os.getenv("DATABASE_URL")
 database_name = os.getenv("DATABASE_NAME")
 
-if database_url and database_name:
-    _client = MongoClient(database_url)
-    db = _client[database_name]
+MIN_POOL_SIZE = 5
+
+def connect_db():
+    """Open the shared client and return its database (None when env vars are missing)"""
+    global _client
+    if not (database_url and database_name):
+        return None
+    if _client is None:
+        _client = AsyncIOMotorClient(
+            database_url,
+            maxPoolSize=50,
+            minPoolSize=MIN_POOL_SIZE,
+            maxIdleTimeMS=30000,
+            serverSelectionTimeoutMS=3000,
+        )
+    return _client[database_name]
+
+def close_db():
+    """Close the shared client and release its pooled connections"""
+    global _client
+    if _client is not None:
+        _client.close()
+    _client = None
+
+class PartialInsertError(Exception):
+    """Raised by create_documents when some documents were inserted and others failed"""
+
+    def __init__(self, inserted_ids: List[str], failed: List[dict]):
+        super().__init__(f"{len(failed)} of {len(inserted_ids) + len(failed)} documents failed to insert")
+        self.inserted_ids = inserted_ids
+        self.failed = failed
 
 # Helper functions for common database operations
-def create_document(collection_name: str, data: Union[BaseModel, dict]):
+async def create_document(db, collection_name: str, data: Union[BaseModel, dict]):
     """Insert a single document with timestamp"""
     if db is None:
         raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
@@ -40,16 +68,33 @@ def create_document(collection_name: str, data: Union[BaseModel, dict]):
     data_dict['created_at'] = datetime.now(timezone.utc)
     data_dict['updated_at'] = datetime.now(timezone.utc)
 
-    result = db[collection_name].insert_one(data_dict)
+    result = await db[collection_name].insert_one(data_dict)
     return str(result.inserted_id)
 
-def get_documents(collection_name: str, filter_dict: dict = None, limit: int = None):
-    """Get documents from collection"""
+async def create_documents(db, collection_name: str, items: List[Union[BaseModel, dict]]):
+    """Insert many documents with timestamps in a single round trip"""
     if db is None:
         raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
-    
-    cursor = db[collection_name].find(filter_dict or {})
-    if limit:
-        cursor = cursor.limit(limit)
-    
-    return list(cursor)
+
+    now = datetime.now(timezone.utc)
+    docs = []
+    for data in items:
+        data_dict = data.model_dump() if isinstance(data, BaseModel) else data.copy()
+        data_dict['created_at'] = now
+        data_dict['updated_at'] = now
+        docs.append(data_dict)
+
+    if not docs:
+        return []
+
+    # insert_many sets _id on each dict in place, so ids are known even when some inserts fail
+    try:
+        await db[collection_name].insert_many(docs, ordered=False)
+    except BulkWriteError as e:
+        write_errors = e.details.get("writeErrors", [])
+        failed_indexes = {err["index"] for err in write_errors}
+        raise PartialInsertError(
+            inserted_ids=[str(d["_id"]) for i, d in enumerate(docs) if i not in failed_indexes],
+            failed=[{"index": err["index"], "code": err.get("code")} for err in write_errors],
+        ) from e
+    return [str(d["_id"]) for d in docs]
@@ -1,32 +1,136 @@
+import asyncio
+import hashlib
+import logging
 import os
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 from typing import List, Optional
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+import orjson
 from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure, PyMongoError
 
-from database import db, create_document, get_documents
-from schemas import Trip, TripLocation
+from database import MIN_POOL_SIZE, PartialInsertError, connect_db, close_db, create_document, create_documents
+from cache import cache_get_raw, cache_set_raw, cache_invalidate
+from schemas import Trip, TRIP_LIST_ADAPTER
 
-app = FastAPI(title="Personal Site API")
+logger = logging.getLogger(__name__)
+
+# MongoDB error code for a unique index violation
+DUPLICATE_KEY = 11000
+
+
+async def _ensure_title_index(db):
+    """Create the unique title index, staying up if old duplicate titles block it."""
+    try:
+        await db["trip"].create_index("title", unique=True)
+    except OperationFailure as e:
+        if e.code != DUPLICATE_KEY:
+            raise
+        logger.warning(
+            "Unique index on trip.title not created: the collection has duplicate titles. "
+            "Remove the duplicates (see README) and restart. %s", e
+        )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if not ALLOWED_ORIGINS:
+        logger.warning("ALLOWED_ORIGINS is not set; cross-origin browser requests will be rejected")
+    # One client per worker process, opened on startup and closed on shutdown
+    db = app.state.db = connect_db()
+    if db is not None:
+        # The driver fills minPoolSize in the background anyway; the pings only make
+        # sure those sockets are open before the first request instead of during it.
+        results = await asyncio.gather(
+            _ensure_title_index(db),
+            *(db.command("ping") for _ in range(MIN_POOL_SIZE)),
+            return_exceptions=True,
+        )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        for error in errors:
+            if not isinstance(error, PyMongoError):
+                raise error
+        if errors:
+            # Keep serving so / and /test can still report the problem
+            logger.warning("MongoDB warm-up failed, starting anyway: %s", errors[0])
+    yield
+    close_db()
+
+
+app = FastAPI(title="Personal Site API", default_response_class=ORJSONResponse, lifespan=lifespan)
+
+TRIPS_LIST_TTL = 300
+TRIP_DETAIL_TTL = 3600
+MAX_TRIPS_PAGE_SIZE = 100
+CLIENT_CACHE_CONTROL = "public, max-age=60"
+# Cached trip bodies are stored as the quoted ETag followed by the JSON bytes;
+# the version keeps entries written in an older format from being read
+TRIPS_CACHE_PREFIX = "trips:v2"
+ETAG_LEN = 34
+# Bounds the request body and the validation work done for one bulk request
+MAX_BULK_TRIPS = 500
+
+_HAS_DB_URL = bool(os.getenv("DATABASE_URL"))
+_HAS_DB_NAME = bool(os.getenv("DATABASE_NAME"))
+
+# /test reuses the collection listing for this many seconds
+COLLECTIONS_TTL = 30
+_collections_cache = {"expires": 0.0, "names": []}
+
+# Comma separated list of frontend origins, e.g. "https://example.com,http://localhost:3000"
+ALLOWED_ORIGINS = [o.strip() for o in os.getenv("ALLOWED_ORIGINS", "").split(",") if o.strip()]
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type", "if-none-match"],
+    expose_headers=["ETag"],
 )
 
 
+def _etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison as If-None-Match requires: W/ prefixes are ignored and * matches anything."""
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
+
+def _conditional_response(request: Request, body: bytes, etag: str) -> Response:
+    """Return 304 when the client already holds this body, else the body with its ETag."""
+    headers = {"ETag": etag, "Cache-Control": CLIENT_CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @app.get("/")
-def read_root():
+async def read_root():
     return {"message": "Personal Site Backend Ready"}
 
 
 @app.get("/test")
-def test_database():
+async def test_database(request: Request):
     """Test endpoint to check if database is available and accessible"""
+    db = request.app.state.db
     response = {
         "backend": "✅ Running",
         "database": "❌ Not Available",
@@ -36,195 +140,283 @@ def test_database():
         "collections": []
     }
 
-    try:
-        if db is not None:
-            response["database"] = "✅ Available"
-            response["database_url"] = "✅ Set" if os.getenv("DATABASE_URL") else "❌ Not Set"
-            response["database_name"] = "✅ Set" if os.getenv("DATABASE_NAME") else "❌ Not Set"
-            response["connection_status"] = "Connected"
-            try:
-                collections = db.list_collection_names()
-                response["collections"] = collections[:10]
-                response["database"] = "✅ Connected & Working"
-            except Exception as e:
-                response["database"] = f"⚠️  Connected but Error: {str(e)[:80]}"
-        else:
-            response["database"] = "⚠️  Available but not initialized"
-
-    except Exception as e:
-        response["database"] = f"❌ Error: {str(e)[:80]}"
+    if db is not None:
+        response["database"] = "✅ Available"
+        response["database_url"] = "✅ Set" if _HAS_DB_URL else "❌ Not Set"
+        response["database_name"] = "✅ Set" if _HAS_DB_NAME else "❌ Not Set"
+        response["connection_status"] = "Connected"
+        try:
+            now = time.monotonic()
+            if now >= _collections_cache["expires"]:
+                _collections_cache["names"] = await db.list_collection_names()
+                _collections_cache["expires"] = now + COLLECTIONS_TTL
+            response["collections"] = _collections_cache["names"][:10]
+            response["database"] = "✅ Connected & Working"
+        except PyMongoError as e:
+            response["database"] = f"⚠️  Connected but Error: {str(e)[:80]}"
+    else:
+        response["database"] = "⚠️  Available but not initialized"
 
     return response
 
 
-# Request model for incoming trip creation
-class TripCreate(BaseModel):
-    title: str
-    date_text: str
-    people: List[str] = []
-    description: Optional[str] = None
-    locations: List[TripLocation] = []
-    photo_placeholders: List[str] = []
-    video_urls: List[str] = []
-
-
 @app.post("/api/trips")
-def create_trip(trip: TripCreate):
-    validated = Trip(**trip.model_dump())
-    inserted_id = create_document("trip", validated)
+async def create_trip(trip: Trip, request: Request):
+    try:
+        inserted_id = await create_document(request.app.state.db, "trip", trip)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=409, detail="A trip with this title already exists")
+    except PyMongoError:
+        raise HTTPException(status_code=503, detail="Database unavailable")
+    await cache_invalidate("trips:*")
     return {"id": inserted_id}
 
 
+@app.post("/api/trips/bulk")
+async def create_trips_bulk(trips: List[Trip], request: Request):
+    """Insert many trips in one request and one insert_many round trip."""
+    if len(trips) > MAX_BULK_TRIPS:
+        raise HTTPException(status_code=413, detail=f"At most {MAX_BULK_TRIPS} trips per request")
+    try:
+        inserted_ids = await create_documents(request.app.state.db, "trip", trips)
+    except PartialInsertError as e:
+        await cache_invalidate("trips:*")
+        detail = {"ids": e.inserted_ids, "failed": [f["index"] for f in e.failed]}
+        if any(f["code"] != DUPLICATE_KEY for f in e.failed):
+            raise HTTPException(status_code=500, detail={"message": "Bulk insert failed", **detail})
+        raise HTTPException(
+            status_code=409,
+            detail={"message": "Trips with duplicate titles were skipped", **detail},
+        )
+    except PyMongoError:
+        raise HTTPException(status_code=503, detail="Database unavailable")
+    await cache_invalidate("trips:*")
+    return {"ids": inserted_ids}
+
+
 @app.get("/api/trips")
-def list_trips():
-    docs = get_documents("trip", {}, None)
+async def list_trips(
+    request: Request,
+    fields: Optional[str] = None,
+    limit: int = Query(50, ge=1),
+    after: Optional[str] = None,
+):
+    """List trips newest first, one page at a time.
+
+    Pass e.g. ?fields=title,date_text,locations,people to receive only those fields,
+    and the previous page's `next` value as ?after= to fetch the following page.
+    """
+    db = request.app.state.db
+    if db is None:
+        raise HTTPException(status_code=500, detail="Database not available")
+    limit = min(limit, MAX_TRIPS_PAGE_SIZE)
+    if after is not None and not ObjectId.is_valid(after):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    projection = None
+    names = sorted({f.strip() for f in (fields or "").split(",") if f.strip()})
+    if names:
+        unknown = [f for f in names if f not in Trip.model_fields]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+        projection = {f: 1 for f in names}
+    # A blank ?fields= means no projection, the same as leaving it out
+    fields = ",".join(names)
+
+    cache_key = f"{TRIPS_CACHE_PREFIX}:all:{fields or ''}:{limit}:{after or ''}"
+    cached = await cache_get_raw(cache_key)
+    if cached is not None:
+        return _conditional_response(request, cached[ETAG_LEN:], cached[:ETAG_LEN].decode())
+
+    query = {"_id": {"$lt": ObjectId(after)}} if after else {}
+    try:
+        docs = await db["trip"].find(query, projection).sort("_id", -1).limit(limit).to_list(length=limit)
+    except PyMongoError:
+        raise HTTPException(status_code=503, detail="Database unavailable")
     for d in docs:
-        if "_id" in d:
-            d["id"] = str(d.pop("_id"))
-    return {"items": docs}
+        d["id"] = str(d.pop("_id"))
+    next_cursor = docs[-1]["id"] if len(docs) == limit else None
+    body = orjson.dumps({"items": docs, "next": next_cursor})
+    etag = _etag(body)
+    await cache_set_raw(cache_key, etag.encode() + body, TRIPS_LIST_TTL)
+    return _conditional_response(request, body, etag)
 
 
 @app.get("/api/trips/{trip_id}")
-def get_trip(trip_id: str):
+async def get_trip(trip_id: str, request: Request):
+    db = request.app.state.db
     if db is None:
         raise HTTPException(status_code=500, detail="Database not available")
     try:
-        doc = db["trip"].find_one({"_id": ObjectId(trip_id)})
-        if not doc:
-            raise HTTPException(status_code=404, detail="Trip not found")
-        doc["id"] = str(doc.pop("_id"))
-        return doc
-    except Exception:
+        oid = ObjectId(trip_id)
+    except InvalidId:
         raise HTTPException(status_code=400, detail="Invalid trip id")
+    cache_key = f"{TRIPS_CACHE_PREFIX}:{trip_id}"
+    cached = await cache_get_raw(cache_key)
+    if cached is not None:
+        return _conditional_response(request, cached[ETAG_LEN:], cached[:ETAG_LEN].decode())
+    try:
+        doc = await db["trip"].find_one({"_id": oid})
+    except PyMongoError:
+        raise HTTPException(status_code=503, detail="Database unavailable")
+    if not doc:
+        raise HTTPException(status_code=404, detail="Trip not found")
+    doc["id"] = str(doc.pop("_id"))
+    body = orjson.dumps(doc)
+    etag = _etag(body)
+    await cache_set_raw(cache_key, etag.encode() + body, TRIP_DETAIL_TTL)
+    return _conditional_response(request, body, etag)
+
+
+_SEED_RAW: List[dict] = [
+    dict(
+        title="Den Haag, Niederlande",
+        date_text="Mai 2019 (genauer Zeitraum nicht mehr erinnerlich)",
+        people=["gesamte Schulklasse"],
+        description="Klassenausflug ans Meer, Strandbesuch und kleine Stadttour.",
+        locations=[dict(country_code="NLD", country_name="Niederlande", city="Den Haag", lat=52.0705, lon=4.3007)],
+        photo_placeholders=["Strandbild", "Gruppenfoto Klasse", "Häuser in Den Haag"],
+        video_urls=[],
+    ),
+    dict(
+        title="Dublin, Irland",
+        date_text="Juli 2019",
+        people=["ich", "meine Mutter", "meine Schwester Shelly"],
+        description="Besuch bei meiner Schwester, die dort als Au-Pair gearbeitet hat; Natur und Stadt.",
+        locations=[dict(country_code="IRL", country_name="Irland", city="Dublin", lat=53.3498, lon=-6.2603)],
+        photo_placeholders=["Familienfoto", "Natur Dublin"],
+        video_urls=[],
+    ),
+    dict(
+        title="Hurghada, Ägypten",
+        date_text="Oktober 2019 (genaues Datum nicht mehr verfügbar)",
+        people=["ich", "meine Mutter"],
+        description="Abenteuerurlaub mit Quad-Tour, Kameltour und Wüstenausflug.",
+        locations=[dict(country_code="EGY", country_name="Ägypten", city="Hurghada", lat=27.2579, lon=33.8116)],
+        photo_placeholders=["Quad", "Wüste", "Kamele"],
+        video_urls=[],
+    ),
+    dict(
+        title="Warschau, Polen",
+        date_text="17.–21. April 2023",
+        people=["Chris Lammel", "Kiran Odell", "Leon Morgenschweiß", "Anton Pfaff", "ich"],
+        description="Städtetrip, Nachtleben, Shooting-Range (Pistole), Fotos auf Hochhäusern.",
+        locations=[dict(country_code="POL", country_name="Polen", city="Warschau", lat=52.2297, lon=21.0122)],
+        photo_placeholders=["Hochhaus"],
+        video_urls=["https://www.youtube.com/watch?v=dQw4w9WgXcQ"],
+    ),
+    dict(
+        title="Budapest, Ungarn",
+        date_text="23.–29. Juni 2024",
+        people=["Peter Rentler", "Jeremy Penzien", "Luca Malik", "ich"],
+        description="Urlaub mit Online-Freundesgruppe, Stadt, Bootstour, Luxusrestaurant, Club.",
+        locations=[dict(country_code="HUN", country_name="Ungarn", city="Budapest", lat=47.4979, lon=19.0402)],
+        photo_placeholders=["Gruppenfoto", "Bootstour", "Restaurant", "Club"],
+        video_urls=[],
+    ),
+    dict(
+        title="Frankreich – Monaco – Italien (Mehrländer-Reise)",
+        date_text="10.–22. August 2024",
+        people=["Anton Pfaff", "Chris Lammel", "Kiran Odell", "ich"],
+        description="Zug/Interrail-Reise, Strand, Meer, Sightseeing, Städte und Natur.",
+        locations=[
+            dict(country_code="FRA", country_name="Frankreich", city="Aix-en-Provence", lat=43.5297, lon=5.4474),
+            dict(country_code="FRA", country_name="Frankreich", city="Nizza", lat=43.7102, lon=7.2620),
+            dict(country_code="MCO", country_name="Monaco", city="Monaco", lat=43.7384, lon=7.4246),
+            dict(country_code="ITA", country_name="Italien", city="Bonassola", lat=44.1799, lon=9.5835),
+            dict(country_code="ITA", country_name="Italien", city="Mailand", lat=45.4642, lon=9.1900),
+        ],
+        photo_placeholders=["Aix-en-Provence", "Nizza", "Monaco", "Bonassola", "Mailand", "Gruppenfoto"],
+        video_urls=[],
+    ),
+    dict(
+        title="Gáldar, Gran Canaria (Spanien)",
+        date_text="14.–17. November 2024",
+        people=["Kiran O’Dell", "ich"],
+        description="Inseltrip mit Rollerfahrten, Natur, mein erstes eigenes Urlaubsvideo.",
+        locations=[dict(country_code="ESP", country_name="Spanien", city="Gáldar (Gran Canaria)", lat=28.1445, lon=-15.6504)],
+        photo_placeholders=["Natur Gran Canaria", "Stadt Gáldar"],
+        video_urls=["https://youtu.be/SGeLnxvfIsI"],
+    ),
+    dict(
+        title="Ukkel, Belgien",
+        date_text="Dezember 2024 (genauer Zeitraum nicht mehr verfügbar)",
+        people=["Luca Malic", "Peter Rändler", "Jeremy Penzien", "ich"],
+        description="Airbnb-Aufenthalt, Stadt, Ausflüge, Video.",
+        locations=[dict(country_code="BEL", country_name="Belgien", city="Ukkel", lat=50.8020, lon=4.3572)],
+        photo_placeholders=["Airbnb", "Stadt Ukkel"],
+        video_urls=["https://youtu.be/kO34SsLgHoY"],
+    ),
+    dict(
+        title="Cúbelles & Barcelona, Spanien",
+        date_text="1.–6. September 2025",
+        people=["Leon Morgenschweiß", "Chris Lammel", "Kiran Odell", "Anton Pfaff", "ich", "Louis Schäfer", "Fabian Stork", "Patrick Mauler"],
+        description="Unterkunft in Cúbelles, tägliche Mietwagenfahrten nach Barcelona, Strand, Stadt, Nachtleben.",
+        locations=[
+            dict(country_code="ESP", country_name="Spanien", city="Cúbelles", lat=41.1950, lon=1.6364),
+            dict(country_code="ESP", country_name="Spanien", city="Barcelona", lat=41.3874, lon=2.1686),
+        ],
+        photo_placeholders=["Gruppenfoto", "Strand Cúbelles", "Barcelona Stadt", "Nachtleben"],
+        video_urls=["https://youtu.be/1ZJsD6BcUNo"],
+    ),
+    dict(
+        title="Montenegro (Bucht von Kotor & Rundreise)",
+        date_text="Datum nicht exakt erinnerlich",
+        people=["Kiran O’Dell", "ich"],
+        description="Mietwagen-Rundreise durch ganz Montenegro, Landschaften, Straßen, Küstenorte, Airbnb in Dobrota.",
+        locations=[
+            dict(country_code="MNE", country_name="Montenegro", city="Kotor (Bucht)", lat=42.4247, lon=18.7712),
+            dict(country_code="MNE", country_name="Montenegro", city="Dobrota", lat=42.4576, lon=18.7684),
+        ],
+        photo_placeholders=["Bucht von Kotor", "Landschaft Montenegro", "Airbnb Dobrota"],
+        video_urls=["https://youtu.be/i6UApGouaDE"],
+    ),
+    dict(
+        title="Brüssel, Belgien",
+        date_text="Datum nicht dokumentiert",
+        people=[],
+        description="Städtetrip nach Brüssel.",
+        locations=[dict(country_code="BEL", country_name="Belgien", city="Brüssel", lat=50.8503, lon=4.3517)],
+        photo_placeholders=["Brüssel Stadt"],
+        video_urls=["https://youtu.be/kO34SsLgHoY"],
+    ),
+]
+
+_SEED_MODELS: List[Trip] = TRIP_LIST_ADAPTER.validate_python(_SEED_RAW)
+
+# Dumped once at import so seeding does no per-request validation
+_SEED_DUMPS: List[dict] = [m.model_dump() for m in _SEED_MODELS]
 
 
 @app.post("/api/seed")
-def seed_trips():
+async def seed_trips(request: Request):
     """Seed initial trips if collection is empty or titles missing."""
+    db = request.app.state.db
     if db is None:
         raise HTTPException(status_code=500, detail="Database not available")
 
-    existing_titles = set([d.get("title") for d in get_documents("trip")])
-
-    seed_data: List[Trip] = [
-        Trip(
-            title="Den Haag, Niederlande",
-            date_text="Mai 2019 (genauer Zeitraum nicht mehr erinnerlich)",
-            people=["gesamte Schulklasse"],
-            description="Klassenausflug ans Meer, Strandbesuch und kleine Stadttour.",
-            locations=[TripLocation(country_code="NLD", country_name="Niederlande", city="Den Haag", lat=52.0705, lon=4.3007)],
-            photo_placeholders=["Strandbild", "Gruppenfoto Klasse", "Häuser in Den Haag"],
-            video_urls=[],
-        ),
-        Trip(
-            title="Dublin, Irland",
-            date_text="Juli 2019",
-            people=["ich", "meine Mutter", "meine Schwester Shelly"],
-            description="Besuch bei meiner Schwester, die dort als Au-Pair gearbeitet hat; Natur und Stadt.",
-            locations=[TripLocation(country_code="IRL", country_name="Irland", city="Dublin", lat=53.3498, lon=-6.2603)],
-            photo_placeholders=["Familienfoto", "Natur Dublin"],
-            video_urls=[],
-        ),
-        Trip(
-            title="Hurghada, Ägypten",
-            date_text="Oktober 2019 (genaues Datum nicht mehr verfügbar)",
-            people=["ich", "meine Mutter"],
-            description="Abenteuerurlaub mit Quad-Tour, Kameltour und Wüstenausflug.",
-            locations=[TripLocation(country_code="EGY", country_name="Ägypten", city="Hurghada", lat=27.2579, lon=33.8116)],
-            photo_placeholders=["Quad", "Wüste", "Kamele"],
-            video_urls=[],
-        ),
-        Trip(
-            title="Warschau, Polen",
-            date_text="17.–21. April 2023",
-            people=["Chris Lammel", "Kiran Odell", "Leon Morgenschweiß", "Anton Pfaff", "ich"],
-            description="Städtetrip, Nachtleben, Shooting-Range (Pistole), Fotos auf Hochhäusern.",
-            locations=[TripLocation(country_code="POL", country_name="Polen", city="Warschau", lat=52.2297, lon=21.0122)],
-            photo_placeholders=["Hochhaus"],
-            video_urls=["https://www.youtube.com/watch?v=dQw4w9WgXcQ"],
-        ),
-        Trip(
-            title="Budapest, Ungarn",
-            date_text="23.–29. Juni 2024",
-            people=["Peter Rentler", "Jeremy Penzien", "Luca Malik", "ich"],
-            description="Urlaub mit Online-Freundesgruppe, Stadt, Bootstour, Luxusrestaurant, Club.",
-            locations=[TripLocation(country_code="HUN", country_name="Ungarn", city="Budapest", lat=47.4979, lon=19.0402)],
-            photo_placeholders=["Gruppenfoto", "Bootstour", "Restaurant", "Club"],
-            video_urls=[],
-        ),
-        Trip(
-            title="Frankreich – Monaco – Italien (Mehrländer-Reise)",
-            date_text="10.–22. August 2024",
-            people=["Anton Pfaff", "Chris Lammel", "Kiran Odell", "ich"],
-            description="Zug/Interrail-Reise, Strand, Meer, Sightseeing, Städte und Natur.",
-            locations=[
-                TripLocation(country_code="FRA", country_name="Frankreich", city="Aix-en-Provence", lat=43.5297, lon=5.4474),
-                TripLocation(country_code="FRA", country_name="Frankreich", city="Nizza", lat=43.7102, lon=7.2620),
-                TripLocation(country_code="MCO", country_name="Monaco", city="Monaco", lat=43.7384, lon=7.4246),
-                TripLocation(country_code="ITA", country_name="Italien", city="Bonassola", lat=44.1799, lon=9.5835),
-                TripLocation(country_code="ITA", country_name="Italien", city="Mailand", lat=45.4642, lon=9.1900),
-            ],
-            photo_placeholders=["Aix-en-Provence", "Nizza", "Monaco", "Bonassola", "Mailand", "Gruppenfoto"],
-            video_urls=[],
-        ),
-        Trip(
-            title="Gáldar, Gran Canaria (Spanien)",
-            date_text="14.–17. November 2024",
-            people=["Kiran O’Dell", "ich"],
-            description="Inseltrip mit Rollerfahrten, Natur, mein erstes eigenes Urlaubsvideo.",
-            locations=[TripLocation(country_code="ESP", country_name="Spanien", city="Gáldar (Gran Canaria)", lat=28.1445, lon=-15.6504)],
-            photo_placeholders=["Natur Gran Canaria", "Stadt Gáldar"],
-            video_urls=["https://youtu.be/SGeLnxvfIsI"],
-        ),
-        Trip(
-            title="Ukkel, Belgien",
-            date_text="Dezember 2024 (genauer Zeitraum nicht mehr verfügbar)",
-            people=["Luca Malic", "Peter Rändler", "Jeremy Penzien", "ich"],
-            description="Airbnb-Aufenthalt, Stadt, Ausflüge, Video.",
-            locations=[TripLocation(country_code="BEL", country_name="Belgien", city="Ukkel", lat=50.8020, lon=4.3572)],
-            photo_placeholders=["Airbnb", "Stadt Ukkel"],
-            video_urls=["https://youtu.be/kO34SsLgHoY"],
-        ),
-        Trip(
-            title="Cúbelles & Barcelona, Spanien",
-            date_text="1.–6. September 2025",
-            people=["Leon Morgenschweiß", "Chris Lammel", "Kiran Odell", "Anton Pfaff", "ich", "Louis Schäfer", "Fabian Stork", "Patrick Mauler"],
-            description="Unterkunft in Cúbelles, tägliche Mietwagenfahrten nach Barcelona, Strand, Stadt, Nachtleben.",
-            locations=[
-                TripLocation(country_code="ESP", country_name="Spanien", city="Cúbelles", lat=41.1950, lon=1.6364),
-                TripLocation(country_code="ESP", country_name="Spanien", city="Barcelona", lat=41.3874, lon=2.1686),
-            ],
-            photo_placeholders=["Gruppenfoto", "Strand Cúbelles", "Barcelona Stadt", "Nachtleben"],
-            video_urls=["https://youtu.be/1ZJsD6BcUNo"],
-        ),
-        Trip(
-            title="Montenegro (Bucht von Kotor & Rundreise)",
-            date_text="Datum nicht exakt erinnerlich",
-            people=["Kiran O’Dell", "ich"],
-            description="Mietwagen-Rundreise durch ganz Montenegro, Landschaften, Straßen, Küstenorte, Airbnb in Dobrota.",
-            locations=[
-                TripLocation(country_code="MNE", country_name="Montenegro", city="Kotor (Bucht)", lat=42.4247, lon=18.7712),
-                TripLocation(country_code="MNE", country_name="Montenegro", city="Dobrota", lat=42.4576, lon=18.7684),
-            ],
-            photo_placeholders=["Bucht von Kotor", "Landschaft Montenegro", "Airbnb Dobrota"],
-            video_urls=["https://youtu.be/i6UApGouaDE"],
-        ),
-        Trip(
-            title="Brüssel, Belgien",
-            date_text="Datum nicht dokumentiert",
-            people=[],
-            description="Städtetrip nach Brüssel.",
-            locations=[TripLocation(country_code="BEL", country_name="Belgien", city="Brüssel", lat=50.8503, lon=4.3517)],
-            photo_placeholders=["Brüssel Stadt"],
-            video_urls=["https://youtu.be/kO34SsLgHoY"],
-        ),
+    now = datetime.now(timezone.utc)
+    ops = [
+        UpdateOne(
+            {"title": t["title"]},
+            {"$setOnInsert": {**t, "created_at": now, "updated_at": now}},
+            upsert=True,
+        )
+        for t in _SEED_DUMPS
     ]
-
-    inserted = 0
-    for t in seed_data:
-        if t.title not in existing_titles:
-            create_document("trip", t)
-            inserted += 1
+    try:
+        result = await db["trip"].bulk_write(ops, ordered=False)
+        inserted = result.upserted_count
+    except BulkWriteError as e:
+        # A concurrent seed upserting the same title loses the race with a duplicate key error;
+        # the other call already inserted that trip, so only other failures are real errors.
+        if any(err.get("code") != DUPLICATE_KEY for err in e.details.get("writeErrors", [])):
+            raise HTTPException(status_code=503, detail="Seeding failed")
+        inserted = e.details.get("nUpserted", 0)
+    except PyMongoError:
+        raise HTTPException(status_code=503, detail="Database unavailable")
+    if inserted:
+        await cache_invalidate("trips:*")
 
     return {"inserted": inserted}
 
@@ -232,4 +424,6 @@ def seed_trips():
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    workers = int(os.getenv("WEB_CONCURRENCY") or os.getenv("WORKERS") or (os.cpu_count() or 1) * 2 + 1)
+    # Each worker process imports main:app on its own and opens its own Mongo pool
+    uvicorn.run("main:app", host="0.0.0.0", port=port, workers=workers, loop="uvloop", http="httptools")
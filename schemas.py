@@ -4,11 +4,16 @@ Database Schemas for the personal website
 Each Pydantic model represents a collection in MongoDB. The collection name is the lowercase of the class name.
 """
 
+import re
 from typing import List, Optional
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
+
+_URL_RE = re.compile(r"https?://", re.IGNORECASE)
 
 
 class TripLocation(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     country_code: str = Field(..., description="ISO A3 country code (e.g., DEU, IRL)")
     country_name: str = Field(..., description="Human readable country name")
     city: Optional[str] = Field(None, description="City or region name")
@@ -22,6 +27,8 @@ class Trip(BaseModel):
     Represents a single travel entry used for the travel map and timeline.
     """
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     title: str = Field(..., description="Trip title")
     date_text: str = Field(..., description="Exact date or descriptive text if not remembered")
     people: List[str] = Field(default_factory=list, description="People who joined the trip")
@@ -32,4 +39,17 @@ class Trip(BaseModel):
 
     # Media
     photo_placeholders: List[str] = Field(default_factory=list, description="List of photo placeholders (captions)")
-    video_urls: List[HttpUrl] = Field(default_factory=list, description="List of YouTube or other video URLs")
+    video_urls: List[str] = Field(default_factory=list, description="List of YouTube or other video URLs")
+
+    @field_validator("video_urls")
+    @classmethod
+    def check_video_urls(cls, urls: List[str]) -> List[str]:
+        # Cheap scheme check instead of a full HttpUrl parse per item
+        for url in urls:
+            if not _URL_RE.match(url):
+                raise ValueError(f"Invalid video URL: {url}")
+        return urls
+
+
+# Validates a whole list of trips in one call instead of one Trip(...) per item
+TRIP_LIST_ADAPTER = TypeAdapter(List[Trip])